@@ -1,6 +1,6 @@
-import { extractPlaceholders } from "./interpolate.js";
+import { extractPlaceholders, PLACEHOLDER_PATTERN } from "./interpolate.js";
 import type { BatchFn } from "./types.js";
-import { readColumn } from "./utils.js";
+import { readColumn, stringifyValue } from "./utils.js";
 
 /**
  * Maximum rows per batch when auto-batching.
@@ -146,21 +146,15 @@ export function wrapSchema(
 /**
  * Format a single column value for inclusion in a batch prompt.
  *
- * Strings are inserted verbatim; numbers/booleans are stringified;
- * objects/arrays are JSON-serialized; `undefined` and `null` become
- * the empty string so the row still renders with its id.
+ * Same rendering as `interpolate` (via `stringifyValue`), except that
+ * `undefined` and `null` become the empty string so the row still
+ * renders with its id.
  */
 function formatValue(value: unknown): string {
   if (value === undefined || value === null) {
     return "";
   }
-  if (typeof value === "string") {
-    return value;
-  }
-  if (typeof value === "number" || typeof value === "boolean") {
-    return String(value);
-  }
-  return JSON.stringify(value);
+  return stringifyValue(value);
 }
 
 /**
@@ -170,13 +164,17 @@ function formatValue(value: unknown): string {
  */
 function renderTaskBlock(instruction: string): string {
   return instruction.replace(
-    /\{([^}]+)\}/g,
+    PLACEHOLDER_PATTERN,
     (_m, raw) => `\`${String(raw).trim()}\``,
   );
 }
 
 /**
- * Render the items section.
+ * Append the items section to a prompt's line list.
+ *
+ * Lines are pushed straight onto `out` so the whole prompt is joined
+ * once, rather than joining the items into a block and then joining
+ * that block into the prompt again.
  *
  * - 0 placeholders → `[id]` per row (no values, degenerate).
  * - 1 placeholder  → `[id] <value>` per row (flat).
@@ -185,34 +183,84 @@ function renderTaskBlock(instruction: string): string {
  *       col1: <value>
  *       col2: <value>
  */
-function renderItemsBlock(
+function appendItemLines(
+  out: string[],
   rows: Array<Record<string, unknown>>,
   placeholders: string[],
-): string {
-  const lines: string[] = [];
+): void {
+  // Pick the layout once per batch rather than re-checking it per row.
+  if (placeholders.length === 0) {
+    for (const row of rows) {
+      out.push(`[${String(row.id)}]`);
+    }
+    return;
+  }
+
+  if (placeholders.length === 1) {
+    const col = placeholders[0];
+    for (const row of rows) {
+      out.push(`[${String(row.id)}] ${formatValue(readColumn(row, col))}`);
+    }
+    return;
+  }
 
   for (const row of rows) {
-    const id = String(row.id);
+    out.push(`[${String(row.id)}]`);
+    for (const col of placeholders) {
+      out.push(`  ${col}: ${formatValue(readColumn(row, col))}`);
+    }
+  }
+}
+
+/**
+ * Prepare a batch prompt renderer for a fixed instruction and context.
+ *
+ * Placeholder extraction and task-block rewriting depend only on the
+ * instruction, so they run once here and every batch in a `run()`
+ * reuses the result.
+ *
+ * @param instruction - Instruction template with `{column}` placeholders.
+ * @param context - Optional context prose prepended to the prompt.
+ * @returns A function that renders the prompt for a batch of rows.
+ */
+export function createBatchPromptBuilder(
+  instruction: string,
+  context?: string,
+): (rows: Array<Record<string, unknown>>) => string {
+  const placeholders = extractPlaceholders(instruction);
+  const taskBlock = renderTaskBlock(instruction);
+
+  return (rows) => {
+    const parts: string[] = [];
 
-    if (placeholders.length === 0) {
-      lines.push(`[${id}]`);
-      continue;
+    if (context) {
+      parts.push(context);
+      parts.push("");
     }
 
+    parts.push("# Task");
+    parts.push(taskBlock);
+    parts.push("");
+
+    parts.push(`# Items (${rows.length})`);
     if (placeholders.length === 1) {
-      const value = readColumn(row, placeholders[0]);
-      lines.push(`[${id}] ${formatValue(value)}`);
-      continue;
+      parts.push(`Each item below is the value of \`${placeholders[0]}\`.`);
+      parts.push("");
+    } else if (placeholders.length > 1) {
+      const cols = placeholders.map((p) => `\`${p}\``).join(", ");
+      parts.push(`Each item below provides ${cols}.`);
+      parts.push("");
     }
+    appendItemLines(parts, rows, placeholders);
+    parts.push("");
 
-    lines.push(`[${id}]`);
-    for (const col of placeholders) {
-      const value = readColumn(row, col);
-      lines.push(`  ${col}: ${formatValue(value)}`);
-    }
-  }
+    parts.push(
+      `Return a JSON object with a 'results' array of exactly ${rows.length} ` +
+        "entries, each including the item's 'id' exactly as shown above.",
+    );
 
-  return lines.join("\n");
+    return parts.join("\n");
+  };
 }
 
 /**
@@ -234,39 +282,7 @@ export function buildBatchPrompt(
   rows: Array<Record<string, unknown>>,
   context?: string,
 ): string {
-  const placeholders = extractPlaceholders(instruction);
-  const taskBlock = renderTaskBlock(instruction);
-  const itemsBlock = renderItemsBlock(rows, placeholders);
-
-  const parts: string[] = [];
-
-  if (context) {
-    parts.push(context);
-    parts.push("");
-  }
-
-  parts.push("# Task");
-  parts.push(taskBlock);
-  parts.push("");
-
-  parts.push(`# Items (${rows.length})`);
-  if (placeholders.length === 1) {
-    parts.push(`Each item below is the value of \`${placeholders[0]}\`.`);
-    parts.push("");
-  } else if (placeholders.length > 1) {
-    const cols = placeholders.map((p) => `\`${p}\``).join(", ");
-    parts.push(`Each item below provides ${cols}.`);
-    parts.push("");
-  }
-  parts.push(itemsBlock);
-  parts.push("");
-
-  parts.push(
-    `Return a JSON object with a 'results' array of exactly ${rows.length} ` +
-      "entries, each including the item's 'id' exactly as shown above.",
-  );
-
-  return parts.join("\n");
+  return createBatchPromptBuilder(instruction, context)(rows);
 }
 
 /**
@@ -2,73 +2,127 @@ import type { SwarmFilter } from "./types.js";
 import { readColumn } from "./utils.js";
 
 /**
- * Compare two values for deep equality.
+ * Build an equality test against a fixed expected value.
  *
  * Handles primitives via `===` and objects/arrays via JSON
  * serialization. `null` and `undefined` only equal themselves.
+ * The expected value is serialized once, so only the candidate
+ * is encoded per comparison.
  *
- * @param a - First value.
- * @param b - Second value.
- * @returns `true` if the values are deeply equal.
+ * @param expected - The value to compare against.
+ * @returns A predicate that is `true` when its argument deeply equals
+ *   `expected`.
  */
-function deepEquals(a: unknown, b: unknown): boolean {
-  if (a === b) {
-    return true;
+function equalsTo(expected: unknown): (value: unknown) => boolean {
+  if (expected == null) {
+    return (value) => value === expected;
   }
 
-  if (a == null || b == null) {
-    return false;
+  const encoded = JSON.stringify(expected);
+  return (value) =>
+    value === expected ||
+    (value != null && JSON.stringify(value) === encoded);
+}
+
+/**
+ * Build a membership test against a fixed list of values.
+ *
+ * Equivalent to `items.some(equalsTo)`, but serializes the candidate
+ * once and looks it up in a set of pre-encoded items.
+ *
+ * @param items - The values to test membership against.
+ * @returns A predicate that is `true` when its argument deeply equals
+ *   any item.
+ */
+function memberOf(items: unknown[]): (value: unknown) => boolean {
+  const encoded = new Set<string | undefined>();
+  for (const item of items) {
+    if (item != null) {
+      encoded.add(JSON.stringify(item));
+    }
   }
+  const hasNull = items.includes(null);
+  const hasUndefined = items.includes(undefined);
 
-  return JSON.stringify(a) === JSON.stringify(b);
+  return (value) => {
+    if (value === null) return hasNull;
+    if (value === undefined) return hasUndefined;
+    return encoded.has(JSON.stringify(value));
+  };
 }
 
 /**
- * Evaluate a filter clause against a single table row.
+ * Compile a filter clause into a reusable row predicate.
  *
  * Supports leaf predicates (`equals`, `notEquals`, `in`, `exists`)
  * and recursive combinators (`and`, `or`). Column paths support
- * dot notation for nested access.
+ * dot notation for nested access. Constant operands are encoded
+ * once here rather than on every row, and malformed clauses are
+ * rejected up front.
  *
- * @param filter - The filter clause to evaluate.
- * @param row - The table row to test against.
- * @returns `true` if the row matches the filter.
+ * @param filter - The filter clause to compile.
+ * @returns A predicate that is `true` when a row matches the filter.
  */
-export function evaluateFilter(
+export function compileFilter(
   filter: SwarmFilter,
-  row: Record<string, unknown>,
-): boolean {
+): (row: Record<string, unknown>) => boolean {
   if (filter == null || typeof filter !== "object") {
     throw new Error(
-      `evaluateFilter: expected a filter object, got ${JSON.stringify(filter)}`,
+      `compileFilter: expected a filter object, got ${JSON.stringify(filter)}`,
     );
   }
 
   if ("and" in filter) {
-    return filter.and.every((f) => evaluateFilter(f, row));
+    const clauses = filter.and.map(compileFilter);
+    return (row) => clauses.every((clause) => clause(row));
   }
 
   if ("or" in filter) {
-    return filter.or.some((f) => evaluateFilter(f, row));
+    const clauses = filter.or.map(compileFilter);
+    return (row) => clauses.some((clause) => clause(row));
   }
 
-  const value = readColumn(row, filter.column);
+  const column = filter.column;
 
   if ("equals" in filter) {
-    return deepEquals(value, filter.equals);
+    const test = equalsTo(filter.equals);
+    return (row) => test(readColumn(row, column));
   }
 
   if ("notEquals" in filter) {
-    return !deepEquals(value, filter.notEquals);
+    const test = equalsTo(filter.notEquals);
+    return (row) => !test(readColumn(row, column));
   }
 
   if ("in" in filter) {
-    return filter.in.some((item) => deepEquals(value, item));
+    const test = memberOf(filter.in);
+    return (row) => test(readColumn(row, column));
   }
 
   if ("exists" in filter) {
-    return filter.exists ? value != null : value == null;
+    const exists = filter.exists;
+    return (row) => {
+      const value = readColumn(row, column);
+      return exists ? value != null : value == null;
+    };
   }
 
-  return false;
+  return () => false;
+}
+
+/**
+ * Evaluate a filter clause against a single table row.
+ *
+ * Convenience wrapper around {@link compileFilter} for one-off checks;
+ * callers testing many rows should compile the filter once instead.
+ *
+ * @param filter - The filter clause to evaluate.
+ * @param row - The table row to test against.
+ * @returns `true` if the row matches the filter.
+ */
+export function evaluateFilter(
+  filter: SwarmFilter,
+  row: Record<string, unknown>,
+): boolean {
+  return compileFilter(filter)(row);
 }
@@ -1,12 +1,12 @@
 import { createTable, loadTable, saveTable } from "./table.js";
-import { interpolate, extractPlaceholders } from "./interpolate.js";
+import { compileTemplate, extractPlaceholders } from "./interpolate.js";
 import { readColumn } from "./utils.js";
-import { evaluateFilter } from "./filter.js";
+import { compileFilter } from "./filter.js";
 import { dispatch, deduplicateFailures, mergeResult } from "./executor.js";
 import {
   resolveBatchGroups,
   wrapSchema,
-  buildBatchPrompt,
+  createBatchPromptBuilder,
   unpackBatchResults,
 } from "./batching.js";
 import type {
@@ -64,6 +64,15 @@ function buildDispatchUnits(
   const units: DispatchUnit[] = [];
   const errors: TaskResult[] = [];
 
+  // Prompts and schemas only depend on the instruction and batch size,
+  // so prepare them once per run instead of once per row or batch.
+  const renderRowPrompt = compileTemplate(opts.instruction);
+  const renderBatchPrompt = createBatchPromptBuilder(
+    opts.instruction,
+    opts.context,
+  );
+  const batchSchemas = new Map<number, Record<string, unknown>>();
+
   let batchIndex = 0;
   for (const batch of batches) {
     if (batch.length === 1) {
@@ -72,7 +81,7 @@ function buildDispatchUnits(
       const rowId = String(row.id);
 
       try {
-        let prompt = interpolate(opts.instruction, row);
+        let prompt = renderRowPrompt(row);
         if (opts.context) {
           prompt = `${opts.context}\n\n${prompt}`;
         }
@@ -97,12 +106,17 @@ function buildDispatchUnits(
     } else {
       // Multi-row batch: build batch prompt, wrap schema
       const rowIds = batch.map((r) => String(r.id));
+      let schema = batchSchemas.get(batch.length);
+      if (!schema) {
+        schema = wrapSchema(opts.responseSchema, batch.length);
+        batchSchemas.set(batch.length, schema);
+      }
       units.push({
         task: {
           id: `batch_${batchIndex}`,
-          prompt: buildBatchPrompt(opts.instruction, batch, opts.context),
+          prompt: renderBatchPrompt(batch),
           subagentType: opts.subagentType,
-          responseSchema: wrapSchema(opts.responseSchema, batch.length),
+          responseSchema: schema,
           mode: opts.mode,
         },
         rowIds,
@@ -114,6 +128,16 @@ function buildDispatchUnits(
   return { units, errors };
 }
 
+/**
+ * Per-row outcome of a dispatch.
+ *
+ * Rows unpacked from a batch response carry their already-parsed
+ * fields in `value`, so merging does not re-encode and re-parse them.
+ */
+interface RowResult extends TaskResult {
+  value?: Record<string, unknown>;
+}
+
 /**
  * Normalize dispatch results into per-row results.
  *
@@ -123,8 +147,8 @@ function buildDispatchUnits(
 function unpackDispatchResults(
   units: DispatchUnit[],
   results: TaskResult[],
-): TaskResult[] {
-  const rowResults: TaskResult[] = [];
+): RowResult[] {
+  const rowResults: RowResult[] = [];
 
   for (let idx = 0; idx < units.length; idx++) {
     const unit = units[idx];
@@ -152,7 +176,7 @@ function unpackDispatchResults(
         rowResults.push({
           id: rowId,
           status: "completed",
-          result: typeof value === "string" ? value : JSON.stringify(value),
+          value: value as Record<string, unknown>,
         });
       } else {
         rowResults.push({
@@ -170,11 +194,12 @@ function unpackDispatchResults(
 /**
  * Parse and merge per-row results into table rows.
  *
- * Each completed result is JSON-parsed and spread onto the
- * corresponding row via `mergeResult`.
+ * Each completed result is spread onto the corresponding row via
+ * `mergeResult`. Single-row responses are JSON-parsed here; batched
+ * rows arrive already parsed.
  */
 function mergeRowResults(
-  rowResults: TaskResult[],
+  rowResults: RowResult[],
   rowById: Map<string, Record<string, unknown>>,
 ): { completed: number; failed: number } {
   let completed = 0;
@@ -187,7 +212,10 @@ function mergeRowResults(
       continue;
     }
 
-    if (result.status === "completed" && result.result != null) {
+    if (result.status === "completed" && result.value) {
+      mergeResult(row, result.value);
+      completed++;
+    } else if (result.status === "completed" && result.result != null) {
       try {
         mergeResult(row, JSON.parse(result.result));
         completed++;
@@ -214,14 +242,24 @@ function validatePlaceholders(
   if (placeholders.length === 0) {
     return;
   }
-  const unresolved = placeholders.filter(
-    (p) => !rows.some((r) => readColumn(r, p) !== undefined),
-  );
-  if (unresolved.length > 0) {
-    throw new Error(
-      `instruction references unknown column(s): ${unresolved.join(", ")}`,
-    );
+
+  // One pass over the rows, retiring each placeholder on its first hit
+  // and stopping as soon as all of them have resolved.
+  const unresolved = new Set(placeholders);
+  for (const row of rows) {
+    for (const p of unresolved) {
+      if (readColumn(row, p) !== undefined) {
+        unresolved.delete(p);
+      }
+    }
+    if (unresolved.size === 0) {
+      return;
+    }
   }
+
+  throw new Error(
+    `instruction references unknown column(s): ${[...unresolved].join(", ")}`,
+  );
 }
 
 /**
@@ -276,9 +314,10 @@ export async function run(
 
   const matched: Record<string, unknown>[] = [];
   let skippedCount = 0;
+  const matches = filter ? compileFilter(filter) : undefined;
 
   for (const row of allRows) {
-    if (!filter || evaluateFilter(filter, row)) {
+    if (!matches || matches(row)) {
       matched.push(row);
     } else {
       skippedCount++;
@@ -353,10 +392,11 @@ export async function run(
 /**
  * Retrieve rows from a table, optionally filtered and projected.
  *
- * Loads the table and applies filter, column projection, and row
- * limiting in that order. Use for inspection and JS-based aggregation
- * — the heavy data stays in the sandbox and only the computed result
- * (via `console.log`) goes back to the agent's context.
+ * Loads the table and applies filter, row limiting, and column
+ * projection. Filtering stops as soon as `limit` rows have matched, and
+ * only the rows being returned are projected. Use for inspection and
+ * JS-based aggregation — the heavy data stays in the sandbox and only
+ * the computed result (via `console.log`) goes back to the agent's context.
  *
  * @param handle - A table handle or object with an `id` field.
  * @param options - Optional filtering, projection, and limiting.
@@ -367,10 +407,26 @@ export async function rows(
   options?: RowsOptions,
 ): Promise<Record<string, unknown>[]> {
   let result = await loadTable(tableId);
+  // Floor once so the filtered early stop matches `slice` semantics.
+  const limit =
+    options?.limit != null && options.limit >= 0
+      ? Math.floor(options.limit)
+      : undefined;
 
   if (options?.filter) {
-    const f = options.filter;
-    result = result.filter((row) => evaluateFilter(f, row));
+    const matches = compileFilter(options.filter);
+    const matched: Record<string, unknown>[] = [];
+    for (const row of result) {
+      if (limit !== undefined && matched.length >= limit) {
+        break;
+      }
+      if (matches(row)) {
+        matched.push(row);
+      }
+    }
+    result = matched;
+  } else if (limit !== undefined) {
+    result = result.slice(0, limit);
   }
 
   if (options?.columns) {
@@ -384,9 +440,5 @@ export async function rows(
     });
   }
 
-  if (options?.limit != null && options.limit >= 0) {
-    result = result.slice(0, options.limit);
-  }
-
   return result;
 }
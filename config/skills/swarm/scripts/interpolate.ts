@@ -1,4 +1,63 @@
-import { readColumn } from "./utils.js";
+import { readColumn, stringifyValue } from "./utils.js";
+
+/**
+ * Matches a `{column}` placeholder, capturing the raw column path.
+ *
+ * Shared so every caller reuses one compiled pattern. Use it only with
+ * `replace` or `matchAll`, which don't leak `lastIndex` between calls.
+ */
+export const PLACEHOLDER_PATTERN = /\{([^}]+)\}/g;
+
+/**
+ * Compile a template string into a reusable per-row renderer.
+ *
+ * The template is scanned once into literal segments and trimmed
+ * column paths, so rendering a row only reads columns and concatenates.
+ * Use this when the same template is applied to many rows; the
+ * renderer behaves exactly like `interpolate`.
+ *
+ * @param template - The instruction template (e.g. `"Review {file} for issues"`).
+ * @returns A function that interpolates the template for a row.
+ */
+export function compileTemplate(
+  template: string,
+): (row: Record<string, unknown>) => string {
+  const literals: string[] = [];
+  const paths: string[] = [];
+  let last = 0;
+  for (const m of template.matchAll(PLACEHOLDER_PATTERN)) {
+    const start = m.index ?? 0;
+    literals.push(template.slice(last, start));
+    paths.push(m[1].trim());
+    last = start + m[0].length;
+  }
+  literals.push(template.slice(last));
+
+  return (row) => {
+    const missing: string[] = [];
+    let result = literals[0];
+
+    for (let idx = 0; idx < paths.length; idx++) {
+      const path = paths[idx];
+      const value = readColumn(row, path);
+      if (value === undefined) {
+        missing.push(path);
+        result += `{${path}}`;
+      } else {
+        result += stringifyValue(value);
+      }
+      result += literals[idx + 1];
+    }
+
+    if (missing.length > 0) {
+      throw new Error(
+        `Interpolation failed: missing columns: ${missing.join(", ")}`,
+      );
+    }
+
+    return result;
+  };
+}
 
 /**
  * Replace `{column}` placeholders in a template string with values
@@ -21,35 +80,7 @@ export function interpolate(
   template: string,
   row: Record<string, unknown>,
 ): string {
-  const missing: string[] = [];
-
-  const result = template.replace(/\{([^}]+)\}/g, (_match, rawPath) => {
-    const path = rawPath.trim();
-
-    const value = readColumn(row, path);
-    if (value === undefined) {
-      missing.push(path);
-      return `{${path}}`;
-    }
-
-    if (typeof value === "string") {
-      return value;
-    }
-
-    if (typeof value === "number" || typeof value === "boolean") {
-      return String(value);
-    }
-
-    return JSON.stringify(value);
-  });
-
-  if (missing.length > 0) {
-    throw new Error(
-      `Interpolation failed: missing columns: ${missing.join(", ")}`,
-    );
-  }
-
-  return result;
+  return compileTemplate(template)(row);
 }
 
 /**
@@ -66,15 +97,12 @@ export function interpolate(
 export function extractPlaceholders(template: string): string[] {
   const seen = new Set<string>();
   const ordered: string[] = [];
-  const re = /\{([^}]+)\}/g;
-  let m: RegExpExecArray | null = re.exec(template);
-  while (m !== null) {
+  for (const m of template.matchAll(PLACEHOLDER_PATTERN)) {
     const path = m[1].trim();
     if (path.length > 0 && !seen.has(path)) {
       seen.add(path);
       ordered.push(path);
     }
-    m = re.exec(template);
   }
   return ordered;
 }
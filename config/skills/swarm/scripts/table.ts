@@ -23,21 +23,48 @@ declare const tools: {
  */
 declare const __sessionId__: string | undefined;
 
+/**
+ * Characters not allowed in a session directory name.
+ */
+const UNSAFE_SESSION_CHARS = /[^a-zA-Z0-9_-]/g;
+
+/**
+ * Matches a table filename (`NNN-t_XXXXXX.jsonl`), capturing the table ID.
+ */
+const TABLE_FILENAME_PATTERN = /^\d+-(t_[a-f0-9]+)\.jsonl$/;
+
+/**
+ * Matches the leading sequence number of a table filename.
+ */
+const SEQUENCE_PREFIX_PATTERN = /^(\d+)-/;
+
 /**
  * Sanitize a session ID for use as a directory name component.
  * Replaces any character that isn't alphanumeric, hyphen, or underscore
  * with an underscore, and caps length to prevent excessively long paths.
  */
 function sanitizeSessionId(id: string): string {
-  return id.replace(/[^a-zA-Z0-9_-]/g, "_").slice(0, 64);
+  return id.replace(UNSAFE_SESSION_CHARS, "_").slice(0, 64);
 }
 
+/**
+ * Most recently resolved table directory and the raw session ID it was
+ * built from, so the ID is only sanitized again when it changes.
+ */
+let tableDirCache: { sessionId: string; dir: string } | undefined;
+
 /**
  * Directory prefix for all table JSONL files, scoped to the session.
  */
 function getTableDir(): string {
   const id = typeof __sessionId__ !== "undefined" ? __sessionId__ : "default";
-  return `/tmp/.swarm/${sanitizeSessionId(id)}`;
+  if (tableDirCache?.sessionId !== id) {
+    tableDirCache = {
+      sessionId: id,
+      dir: `/tmp/.swarm/${sanitizeSessionId(id)}`,
+    };
+  }
+  return tableDirCache.dir;
 }
 
 /**
@@ -45,6 +72,11 @@ function getTableDir(): string {
  */
 const MAX_TABLES = 5;
 
+/**
+ * Maximum number of eviction overwrites in flight at once.
+ */
+const MAX_EVICT_CONCURRENCY = 4;
+
 /**
  * A table's rows and backend file path, cached in memory to avoid
  * redundant PTC reads within the same session.
@@ -72,6 +104,19 @@ interface CachedTable {
  */
 const cache = new Map<string, CachedTable>();
 
+/**
+ * In-flight backend reads keyed by table ID, so concurrent cache misses
+ * for the same table share one listing and read.
+ */
+const pendingLoads = new Map<string, Promise<Record<string, unknown>[]>>();
+
+/**
+ * Backend paths already overwritten by eviction. Evicted files stay in
+ * the listing (there is no delete tool), so this keeps each create from
+ * overwriting every previously evicted table again.
+ */
+const evictedPaths = new Set<string>();
+
 /**
  * Monotonic counter for table file sequence numbers.
  */
@@ -80,10 +125,13 @@ let sequenceCounter = 0;
 /**
  * Reset all module-level state for testing.
  *
- * Clears the in-memory cache and resets the sequence counter.
+ * Clears the in-memory cache, pending loads, and evicted paths, and
+ * resets the sequence counter.
  */
 export function _resetForTesting(): void {
   cache.clear();
+  pendingLoads.clear();
+  evictedPaths.clear();
   sequenceCounter = 0;
 }
 
@@ -131,10 +179,6 @@ export function serializeJsonl(rows: Record<string, unknown>[]): string {
  * @throws Error with line number if any line is malformed.
  */
 export function parseJsonl(content: string): Record<string, unknown>[] {
-  if (!content.trim()) {
-    return [];
-  }
-
   const parseLine = (line: string, idx: number): Record<string, unknown> => {
     try {
       const parsed = JSON.parse(line);
@@ -154,10 +198,28 @@ export function parseJsonl(content: string): Record<string, unknown>[] {
     }
   };
 
-  return content
-    .split("\n")
-    .filter((line) => line.trim() !== "")
-    .map(parseLine);
+  // Single pass over the lines: no intermediate filtered array, and line
+  // numbers in errors match the physical line in the file.
+  const rows: Record<string, unknown>[] = [];
+  const lines = content.split("\n");
+  for (let idx = 0; idx < lines.length; idx++) {
+    const line = lines[idx];
+    if (line.trim() !== "") {
+      rows.push(parseLine(line, idx));
+    }
+  }
+
+  return rows;
+}
+
+/**
+ * Return the last `/`-separated segment of a path.
+ *
+ * Slices from the last separator instead of splitting the whole path
+ * into an array of segments.
+ */
+function basename(filePath: string): string {
+  return filePath.slice(filePath.lastIndexOf("/") + 1);
 }
 
 /**
@@ -168,8 +230,8 @@ export function parseJsonl(content: string): Record<string, unknown>[] {
  *          filename doesn't match the expected pattern.
  */
 export function extractIdFromPath(filePath: string): string | undefined {
-  const filename = filePath.split("/").pop() || "";
-  const match = filename.match(/^\d+-(t_[a-f0-9]+)\.jsonl$/);
+  const filename = basename(filePath);
+  const match = TABLE_FILENAME_PATTERN.exec(filename);
   return match ? match[1] : undefined;
 }
 
@@ -180,8 +242,8 @@ export function extractIdFromPath(filePath: string): string | undefined {
  * @returns The sequence number, or `0` if the filename doesn't match.
  */
 export function extractSeqFromPath(filePath: string): number {
-  const filename = filePath.split("/").pop() || "";
-  const match = filename.match(/^(\d+)-/);
+  const filename = basename(filePath);
+  const match = SEQUENCE_PREFIX_PATTERN.exec(filename);
   return match ? parseInt(match[1], 10) : 0;
 }
 
@@ -198,10 +260,7 @@ export function extractSeqFromPath(filePath: string): number {
 export function pathsToRows(
   paths: string[],
 ): Array<{ id: string; file: string }> {
-  const basenames = paths.map((p) => {
-    const parts = p.split("/");
-    return parts[parts.length - 1] || p;
-  });
+  const basenames = paths.map((p) => basename(p) || p);
 
   const counts = new Map<string, number>();
   for (const basename of basenames) {
@@ -211,9 +270,10 @@ export function pathsToRows(
   return paths.map((filePath, idx) => {
     let id = basenames[idx];
     if ((counts.get(id) ?? 0) > 1) {
-      const parts = filePath.split("/");
-      if (parts.length >= 2) {
-        id = `${parts[parts.length - 2]}-${id}`;
+      const slash = filePath.lastIndexOf("/");
+      if (slash !== -1) {
+        const parentStart = filePath.lastIndexOf("/", slash - 1) + 1;
+        id = `${filePath.slice(parentStart, slash)}-${id}`;
       }
     }
     return { id, file: filePath };
@@ -340,59 +400,88 @@ export async function writeFile(
 }
 
 /**
- * List all table JSONL files in the `.swarm/` directory, sorted by
- * filename (which encodes creation order via the sequence prefix).
+ * Glob all table JSONL files in the `.swarm/` directory, in whatever
+ * order the backend returns them.
  *
- * @returns Sorted array of file paths, or empty array on failure.
+ * @returns Array of file paths, or empty array on failure.
  */
-async function listTableFiles(): Promise<string[]> {
+async function globTableFiles(): Promise<string[]> {
   try {
-    const files = await globFiles(`${getTableDir()}/*.jsonl`);
-    return files.sort();
+    return await globFiles(`${getTableDir()}/*.jsonl`);
   } catch {
     return [];
   }
 }
 
+/**
+ * List all table JSONL files in the `.swarm/` directory, sorted by
+ * filename (which encodes creation order via the sequence prefix).
+ *
+ * @returns Sorted array of file paths, or empty array on failure.
+ */
+async function listTableFiles(): Promise<string[]> {
+  const files = await globTableFiles();
+  return files.sort();
+}
+
 /**
  * Evict the oldest tables when the count meets or exceeds `MAX_TABLES`.
  *
  * Clears evicted entries from the in-memory cache and overwrites
  * backend files with empty content (no delete_file tool available).
- * Empty files are treated as evicted by `loadTable`.
+ * Empty files are treated as evicted by `loadTable`. Paths evicted
+ * earlier in the session are skipped.
+ *
+ * @param files - Sorted table file listing from `listTableFiles`.
  */
-async function evict(): Promise<void> {
-  const files = await listTableFiles();
+async function evict(files: string[]): Promise<void> {
   if (files.length < MAX_TABLES) {
     return;
   }
 
-  const toEvict = files.slice(0, files.length - MAX_TABLES + 1);
-  for (const filePath of toEvict) {
-    const id = extractIdFromPath(filePath);
-    const prev = id ? cache.get(id)?.lastWritten : undefined;
-    if (id) {
-      cache.delete(id);
-    }
-    try {
-      await writeFile(filePath, "", prev);
-    } catch {
-      // Best-effort eviction — non-fatal if overwrite fails
+  const toEvict = files
+    .slice(0, files.length - MAX_TABLES + 1)
+    .filter((filePath) => !evictedPaths.has(filePath));
+
+  // Overwrites are independent, so run them through a small worker pool
+  // rather than one backend round-trip at a time. The pool bounds the
+  // burst when a new session finds many unevicted tables on disk.
+  let idx = 0;
+  async function worker(): Promise<void> {
+    while (idx < toEvict.length) {
+      const filePath = toEvict[idx++];
+      evictedPaths.add(filePath);
+      const id = extractIdFromPath(filePath);
+      const prev = id ? cache.get(id)?.lastWritten : undefined;
+      if (id) {
+        cache.delete(id);
+      }
+      try {
+        await writeFile(filePath, "", prev);
+      } catch {
+        // Best-effort eviction — non-fatal if overwrite fails
+      }
     }
   }
+
+  const workers: Promise<void>[] = [];
+  for (let w = 0; w < Math.min(MAX_EVICT_CONCURRENCY, toEvict.length); w++) {
+    workers.push(worker());
+  }
+  await Promise.all(workers);
 }
 
 /**
  * Determine the next sequence number for a new table file.
  *
- * Reads existing files on the backend to avoid sequence collisions
+ * Uses the existing files on the backend to avoid sequence collisions
  * across runs (same thread, new session). The counter only advances
  * forward — it never reuses a sequence number.
  *
+ * @param files - Sorted table file listing from `listTableFiles`.
  * @returns The next available sequence number.
  */
-async function nextSequence(): Promise<number> {
-  const files = await listTableFiles();
+function nextSequence(files: string[]): number {
   if (files.length > 0) {
     const lastSequence = extractSeqFromPath(files[files.length - 1]);
     if (lastSequence >= sequenceCounter) {
@@ -412,13 +501,11 @@ async function nextSequence(): Promise<number> {
  */
 async function resolveGlob(pattern: string | string[]): Promise<string[]> {
   const patterns = Array.isArray(pattern) ? pattern : [pattern];
-  const allPaths: string[] = [];
-  for (const p of patterns) {
-    const paths = await globFiles(p);
-    allPaths.push(...paths);
-  }
+  // Patterns are independent, so resolve them concurrently rather than
+  // paying one backend round-trip per pattern in sequence.
+  const results = await Promise.all(patterns.map((p) => globFiles(p)));
 
-  const unique = [...new Set(allPaths)].sort();
+  const unique = [...new Set(results.flat())].sort();
   if (unique.length === 0) {
     throw new Error(`No files matched pattern: ${JSON.stringify(pattern)}`);
   }
@@ -482,10 +569,13 @@ export async function createTable(source: CreateSource): Promise<SwarmHandle> {
     throw new Error(`create() received duplicate row ids: ${dupes.join(", ")}`);
   }
 
-  await evict();
+  // Eviction empties files rather than deleting them, so a single listing
+  // serves both eviction and sequence numbering.
+  const existing = await listTableFiles();
+  await evict(existing);
 
   const id = generateId();
-  const seq = await nextSequence();
+  const seq = nextSequence(existing);
   const path = tablePath(seq, id);
 
   const content = serializeJsonl(rows);
@@ -504,7 +594,8 @@ export async function createTable(source: CreateSource): Promise<SwarmHandle> {
  *
  * Checks the in-memory cache first. On a cache miss (e.g. cross-run
  * resume), globs the backend to locate the JSONL file, reads and
- * parses it, and populates the cache.
+ * parses it, and populates the cache. Concurrent misses for the same
+ * table share a single backend read.
  *
  * @param id - The table ID from a `SwarmHandle`.
  * @returns The table's row array (by reference — mutations are visible).
@@ -518,8 +609,27 @@ export async function loadTable(
     return cached.rows;
   }
 
-  const files = await listTableFiles();
-  const match = files.find((f) => f.endsWith(`-${id}.jsonl`));
+  let pending = pendingLoads.get(id);
+  if (!pending) {
+    pending = readTable(id).finally(() => pendingLoads.delete(id));
+    pendingLoads.set(id, pending);
+  }
+
+  return pending;
+}
+
+/**
+ * Read a table from the backend and populate the cache.
+ *
+ * @param id - The table ID to read.
+ * @returns The parsed row array.
+ * @throws Error if the table is not found (evicted or never created).
+ */
+async function readTable(id: string): Promise<Record<string, unknown>[]> {
+  // Lookup by ID doesn't depend on creation order, so skip the sort.
+  const files = await globTableFiles();
+  const suffix = `-${id}.jsonl`;
+  const match = files.find((f) => f.endsWith(suffix));
   if (!match) {
     throw new Error(`Table "${id}" not found. It may have been evicted`);
   }
@@ -529,8 +639,10 @@ export async function loadTable(
     throw new Error(`Table "${id}" not found. It may have been evicted`);
   }
 
+  // The content just read is exactly what's on the backend, so it can
+  // serve as the editFile `old_string` without re-serializing the rows.
   const rows = parseJsonl(content);
-  cache.set(id, { rows, path: match, lastWritten: serializeJsonl(rows) });
+  cache.set(id, { rows, path: match, lastWritten: content });
 
   return rows;
 }
@@ -26,3 +26,25 @@ export function readColumn(
 
   return current[segments[segments.length - 1]];
 }
+
+/**
+ * Render a column value as prompt text.
+ *
+ * Strings are returned verbatim, numbers and booleans are stringified,
+ * and everything else (objects, arrays, `null`) is JSON-serialized.
+ * Callers decide how to treat `undefined` before calling.
+ *
+ * @param value - The column value to render.
+ * @returns The value as a string.
+ */
+export function stringifyValue(value: unknown): string {
+  if (typeof value === "string") {
+    return value;
+  }
+
+  if (typeof value === "number" || typeof value === "boolean") {
+    return String(value);
+  }
+
+  return JSON.stringify(value);
+}
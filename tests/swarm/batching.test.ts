@@ -5,6 +5,7 @@ import {
   MAX_BATCH_SIZE,
   wrapSchema,
   buildBatchPrompt,
+  createBatchPromptBuilder,
   unpackBatchResults,
 } from "#swarm/batching.js";
 
@@ -277,6 +278,33 @@ describe("buildBatchPrompt", () => {
   });
 });
 
+// ---------------------------------------------------------------------------
+// createBatchPromptBuilder
+// ---------------------------------------------------------------------------
+
+describe("createBatchPromptBuilder", () => {
+  it("renders the same prompt as buildBatchPrompt", () => {
+    const render = createBatchPromptBuilder("Review {file}", "TS project");
+    const rows = [
+      { id: "r1", file: "a.ts" },
+      { id: "r2", file: "b.ts" },
+    ];
+    expect(render(rows)).toBe(
+      buildBatchPrompt("Review {file}", rows, "TS project"),
+    );
+  });
+
+  it("can be reused across batches", () => {
+    const render = createBatchPromptBuilder("Classify {text}");
+    const first = render([{ id: "r1", text: "hi" }]);
+    const second = render([{ id: "r2", text: "bye" }]);
+    expect(first).toContain("[r1] hi");
+    expect(first).not.toContain("[r2]");
+    expect(second).toContain("[r2] bye");
+    expect(second).toContain("# Items (1)");
+  });
+});
+
 // ---------------------------------------------------------------------------
 // unpackBatchResults
 // ---------------------------------------------------------------------------
@@ -0,0 +1,37 @@
+import { vi } from "vitest";
+
+/**
+ * Build in-memory stubs for the PTC file tools (`glob`, `readFile`,
+ * `writeFile`) backed by the given map of path → content.
+ *
+ * `glob` supports `*` wildcards within a single path segment, which is
+ * all the table module needs.
+ */
+export function createFileTools(files: Map<string, string>) {
+  return {
+    glob: vi.fn(async ({ pattern }: { pattern: string }) => {
+      const escaped = pattern.replace(/[.+^${}()|[\]\\]/g, "\\$&");
+      const regex = new RegExp("^" + escaped.replace(/\*/g, "[^/]*") + "$");
+      const matched = [...files.keys()].filter((f) => regex.test(f));
+      return JSON.stringify(matched);
+    }),
+    readFile: vi.fn(async ({ file_path }: { file_path: string }) => {
+      const content = files.get(file_path);
+      if (content === undefined)
+        throw new Error(`File not found: ${file_path}`);
+      return content;
+    }),
+    writeFile: vi.fn(
+      async ({
+        file_path,
+        content,
+      }: {
+        file_path: string;
+        content: string;
+      }) => {
+        files.set(file_path, content);
+        return "ok";
+      },
+    ),
+  };
+}
@@ -1,5 +1,5 @@
 import { describe, it, expect } from "vitest";
-import { evaluateFilter } from "#swarm/filter.js";
+import { compileFilter, evaluateFilter } from "#swarm/filter.js";
 import type { SwarmFilter } from "#swarm/types.js";
 
 const row = {
@@ -69,6 +69,21 @@ describe("evaluateFilter", () => {
         evaluateFilter({ column: "status", in: ["pending", "failed"] }, row),
       ).toBe(false);
     });
+
+    it("compares objects structurally and null only to null", () => {
+      const nested = { meta: { tag: { a: 1 } }, missing: null };
+      const filter: SwarmFilter = {
+        column: "meta.tag",
+        in: [{ a: 2 }, { a: 1 }],
+      };
+      expect(evaluateFilter(filter, nested)).toBe(true);
+      expect(
+        evaluateFilter({ column: "missing", in: ["null", undefined] }, nested),
+      ).toBe(false);
+      expect(
+        evaluateFilter({ column: "missing", in: [null] }, nested),
+      ).toBe(true);
+    });
   });
 
   describe("exists", () => {
@@ -186,3 +201,17 @@ describe("evaluateFilter", () => {
     });
   });
 });
+
+describe("compileFilter", () => {
+  it("returns a predicate reusable across rows", () => {
+    const matches = compileFilter({ column: "status", in: ["done", "failed"] });
+    expect(matches({ status: "done" })).toBe(true);
+    expect(matches({ status: "pending" })).toBe(false);
+    expect(matches({ status: "failed" })).toBe(true);
+  });
+
+  it("rejects a malformed clause before any row is tested", () => {
+    const filter = { and: [null as unknown as SwarmFilter] };
+    expect(() => compileFilter(filter)).toThrow("expected a filter object");
+  });
+});
@@ -1,6 +1,8 @@
 import { describe, it, expect, beforeEach, vi } from "vitest";
 import { create, run, rows } from "#swarm/index.js";
 import { _resetForTesting } from "#swarm/table.js";
+import type { SwarmFilter } from "#swarm/types.js";
+import { createFileTools } from "./file-tools.js";
 
 // ---------------------------------------------------------------------------
 // In-memory file system + task stub for all PTC tools
@@ -17,30 +19,7 @@ const resultSchema = {
 function setupTools() {
   files = new Map();
   (globalThis as Record<string, unknown>).tools = {
-    glob: vi.fn(async ({ pattern }: { pattern: string }) => {
-      const escaped = pattern.replace(/[.+^${}()|[\]\\]/g, "\\$&");
-      const regex = new RegExp("^" + escaped.replace(/\*/g, "[^/]*") + "$");
-      const matched = [...files.keys()].filter((f) => regex.test(f));
-      return JSON.stringify(matched);
-    }),
-    readFile: vi.fn(async ({ file_path }: { file_path: string }) => {
-      const content = files.get(file_path);
-      if (content === undefined)
-        throw new Error(`File not found: ${file_path}`);
-      return content;
-    }),
-    writeFile: vi.fn(
-      async ({
-        file_path,
-        content,
-      }: {
-        file_path: string;
-        content: string;
-      }) => {
-        files.set(file_path, content);
-        return "ok";
-      },
-    ),
+    ...createFileTools(files),
     swarmTask: vi.fn(async ({ description }: { description: string }) =>
       JSON.stringify({ result: `Result for: ${description}` }),
     ),
@@ -701,4 +680,18 @@ describe("rows", () => {
     expect(data).toHaveLength(2);
     expect(Object.keys(data[0])).toEqual(["id", "score"]);
   });
+
+  it("truncates a fractional limit with or without a filter", async () => {
+    const handle = await create({
+      tasks: [
+        { id: "r1", status: "done" },
+        { id: "r2", status: "done" },
+        { id: "r3", status: "done" },
+      ],
+    });
+    const filter: SwarmFilter = { column: "status", equals: "done" };
+    expect(await rows(handle.id, { limit: 1.5 })).toHaveLength(1);
+    expect(await rows(handle.id, { filter, limit: 1.5 })).toHaveLength(1);
+    expect(await rows(handle.id, { filter, limit: 2.5 })).toHaveLength(2);
+  });
 });
@@ -1,5 +1,5 @@
 import { describe, it, expect } from "vitest";
-import { interpolate } from "#swarm/interpolate.js";
+import { compileTemplate, interpolate } from "#swarm/interpolate.js";
 
 describe("interpolate", () => {
   it("replaces a single placeholder", () => {
@@ -63,3 +63,28 @@ describe("interpolate", () => {
     expect(interpolate("", { file: "a.ts" })).toBe("");
   });
 });
+
+describe("compileTemplate", () => {
+  it("renders each row like interpolate", () => {
+    const render = compileTemplate("Review {file} ({ meta.lang })");
+    const rows = [
+      { file: "a.ts", meta: { lang: "ts" } },
+      { file: "b.py", meta: { lang: "py" } },
+    ];
+    for (const row of rows) {
+      expect(render(row)).toBe(
+        interpolate("Review {file} ({ meta.lang })", row),
+      );
+    }
+  });
+
+  it("keeps leading and trailing literal text", () => {
+    const render = compileTemplate("<{a}|{b}>");
+    expect(render({ a: 1, b: "x" })).toBe("<1|x>");
+  });
+
+  it("throws listing every missing column for a row", () => {
+    const render = compileTemplate("{a} {b} {c}");
+    expect(() => render({ b: 1 })).toThrow("missing columns: a, c");
+  });
+});
@@ -16,6 +16,7 @@ import {
   _resetForTesting,
 } from "#swarm/table.js";
 import { SwarmHandle } from "#swarm/types.js";
+import { createFileTools } from "./file-tools.js";
 
 // ---------------------------------------------------------------------------
 // In-memory file system stub for PTC tools
@@ -25,32 +26,7 @@ let files: Map<string, string>;
 
 function setupTools(existingFiles?: Map<string, string>) {
   files = existingFiles ?? new Map();
-  (globalThis as Record<string, unknown>).tools = {
-    glob: vi.fn(async ({ pattern }: { pattern: string }) => {
-      const escaped = pattern.replace(/[.+^${}()|[\]\\]/g, "\\$&");
-      const regex = new RegExp("^" + escaped.replace(/\*/g, "[^/]*") + "$");
-      const matched = [...files.keys()].filter((f) => regex.test(f));
-      return JSON.stringify(matched);
-    }),
-    readFile: vi.fn(async ({ file_path }: { file_path: string }) => {
-      const content = files.get(file_path);
-      if (content === undefined)
-        throw new Error(`File not found: ${file_path}`);
-      return content;
-    }),
-    writeFile: vi.fn(
-      async ({
-        file_path,
-        content,
-      }: {
-        file_path: string;
-        content: string;
-      }) => {
-        files.set(file_path, content);
-        return "ok";
-      },
-    ),
-  };
+  (globalThis as Record<string, unknown>).tools = createFileTools(files);
 }
 
 beforeEach(() => {
@@ -127,6 +103,11 @@ describe("serializeJsonl / parseJsonl", () => {
     const content = '{"id":"a"}\nnot json';
     expect(() => parseJsonl(content)).toThrow("line 2");
   });
+
+  it("parseJsonl reports the physical line number past blank lines", () => {
+    const content = '{"id":"a"}\n\nnot json';
+    expect(() => parseJsonl(content)).toThrow("line 3");
+  });
 });
 
 describe("extractIdFromPath", () => {
@@ -318,6 +299,30 @@ describe("createTable", () => {
     expect(handle.count).toBe(2);
   });
 
+  it("merges and dedupes matches across glob patterns", async () => {
+    const tools = (globalThis as Record<string, unknown>).tools as Record<
+      string,
+      unknown
+    >;
+    const byPattern: Record<string, string[]> = {
+      "src/*.ts": ["src/b.ts", "src/a.ts"],
+      "lib/*.ts": ["lib/c.ts", "src/a.ts"],
+    };
+    tools.glob = vi.fn(async ({ pattern }: { pattern: string }) =>
+      JSON.stringify(byPattern[pattern] ?? []),
+    );
+
+    const handle = await createTable({ glob: ["src/*.ts", "lib/*.ts"] });
+    expect(handle.count).toBe(3);
+
+    const rows = await loadTable(handle.id);
+    expect(rows.map((r) => r.file)).toEqual([
+      "lib/c.ts",
+      "src/a.ts",
+      "src/b.ts",
+    ]);
+  });
+
   it("persists the table as JSONL to the backend", async () => {
     const handle = await createTable({
       tasks: [{ id: "t1", value: 1 }],
@@ -328,6 +333,15 @@ describe("createTable", () => {
     expect(content).toContain('"id":"t1"');
   });
 
+  it("lists existing tables once per create", async () => {
+    await createTable({ tasks: [{ id: "r1" }] });
+    const tools = (globalThis as Record<string, unknown>).tools as Record<
+      string,
+      ReturnType<typeof vi.fn>
+    >;
+    expect(tools.glob).toHaveBeenCalledTimes(1);
+  });
+
   it("throws when zero sources are provided", async () => {
     await expect(createTable({})).rejects.toThrow("exactly one source");
   });
@@ -381,6 +395,25 @@ describe("loadTable", () => {
     expect(rows).toEqual([{ id: "r1", val: "a" }]);
   });
 
+  it("shares one backend read between concurrent cache misses", async () => {
+    const handle = await createTable({
+      tasks: [{ id: "r1", val: "a" }],
+    });
+    _resetForTesting();
+    setupTools(files);
+
+    const [first, second] = await Promise.all([
+      loadTable(handle.id),
+      loadTable(handle.id),
+    ]);
+    expect(first).toBe(second);
+    const tools = (globalThis as Record<string, unknown>).tools as Record<
+      string,
+      ReturnType<typeof vi.fn>
+    >;
+    expect(tools.readFile).toHaveBeenCalledTimes(1);
+  });
+
   it("throws for a nonexistent table", async () => {
     await expect(loadTable("t_doesnt_exist")).rejects.toThrow("not found");
   });
@@ -430,6 +463,49 @@ describe("eviction", () => {
     expect(files.get(firstPath as string)).toBe("");
   });
 
+  it("overwrites each evicted table only once", async () => {
+    for (let i = 0; i < 12; i++) {
+      await createTable({ tasks: [{ id: `row-${i}` }] });
+    }
+
+    const tools = (globalThis as Record<string, unknown>).tools as Record<
+      string,
+      ReturnType<typeof vi.fn>
+    >;
+    const evictions = tools.writeFile.mock.calls.filter(
+      ([args]) => args.content === "",
+    );
+    // Creates 6 through 12 each push exactly one new table out.
+    expect(evictions).toHaveLength(7);
+  });
+
+  it("bounds concurrent overwrites when evicting many tables", async () => {
+    for (let i = 0; i < 12; i++) {
+      const seq = String(i).padStart(3, "0");
+      files.set(`/tmp/.swarm/default/${seq}-t_abc${i}.jsonl`, '{"id":"x"}');
+    }
+    const tools = (globalThis as Record<string, unknown>).tools as Record<
+      string,
+      ReturnType<typeof vi.fn>
+    >;
+    const write = tools.writeFile.getMockImplementation()!;
+    let inFlight = 0;
+    let peak = 0;
+    tools.writeFile.mockImplementation(async (args) => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 1));
+      inFlight--;
+      return write(args);
+    });
+
+    await createTable({ tasks: [{ id: "r1" }] });
+
+    const evicted = [...files.values()].filter((c) => c === "");
+    expect(evicted).toHaveLength(8);
+    expect(peak).toBe(4);
+  });
+
   it("evicted tables are not loadable", async () => {
     const handles = [];
     for (let i = 0; i < 6; i++) {
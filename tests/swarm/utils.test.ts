@@ -1,5 +1,5 @@
 import { describe, it, expect } from "vitest";
-import { readColumn } from "#swarm/utils.js";
+import { readColumn, stringifyValue } from "#swarm/utils.js";
 
 describe("readColumn", () => {
   it("reads a top-level key", () => {
@@ -45,3 +45,21 @@ describe("readColumn", () => {
     expect(readColumn(arr, "items")).toEqual([1, 2, 3]);
   });
 });
+
+describe("stringifyValue", () => {
+  it("returns strings verbatim", () => {
+    expect(stringifyValue("a.ts")).toBe("a.ts");
+    expect(stringifyValue("")).toBe("");
+  });
+
+  it("stringifies numbers and booleans", () => {
+    expect(stringifyValue(42)).toBe("42");
+    expect(stringifyValue(false)).toBe("false");
+  });
+
+  it("JSON-serializes objects, arrays, and null", () => {
+    expect(stringifyValue({ x: 1 })).toBe('{"x":1}');
+    expect(stringifyValue([1, 2])).toBe("[1,2]");
+    expect(stringifyValue(null)).toBe("null");
+  });
+});